@@ -1,4 +1,8 @@
-from openai import OpenAI
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultAsyncHttpxClient
+
+# Connection limits for the async HTTP/2 client, which multiplexes concurrent requests over shared connections.
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
 
 def create_openai_client(api_key: str) -> OpenAI:
     """
@@ -20,3 +24,31 @@ def create_openai_client(api_key: str) -> OpenAI:
     if not api_key:
         raise ValueError("API key cannot be None or empty")
     return OpenAI(api_key=api_key)
+
+def create_async_openai_client(api_key: str, max_retries: int = 2) -> AsyncOpenAI:
+    """
+    Creates and returns an asynchronous OpenAI client instance.
+
+    The async client lets several image generation requests be in flight at
+    the same time, multiplexed over a single HTTP/2 connection instead of one
+    TLS connection each. It should be created and closed inside the event loop
+    that uses it, e.g. with ``async with create_async_openai_client(key) as client``.
+
+    Args:
+        api_key (str): The API key for authenticating with OpenAI services.
+        max_retries (int): How many times the SDK itself retries failed requests.
+            Pass 0 when the caller implements its own retry policy.
+
+    Returns:
+        AsyncOpenAI: An initialized asynchronous OpenAI client instance.
+
+    Raises:
+        ValueError: If the api_key is None or an empty string.
+    """
+    if not api_key:
+        raise ValueError("API key cannot be None or empty")
+    return AsyncOpenAI(
+        api_key=api_key,
+        max_retries=max_retries,
+        http_client=DefaultAsyncHttpxClient(http2=True, limits=HTTP_LIMITS)
+    )
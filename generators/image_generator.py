@@ -1,4 +1,14 @@
-from openai import OpenAI
+from openai import (OpenAI, AsyncOpenAI, APIConnectionError, APITimeoutError,
+                    InternalServerError, RateLimitError)
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from typing import List
+from utils.rate_limiter import RateLimiter
+
+# The model used for the app's image generation.
+IMAGE_MODEL = "dall-e-3"
+
+# Images a single request may ask for: DALL-E 3 only accepts n=1, DALL-E 2 up to 10.
+MAX_IMAGES_PER_REQUEST = {"dall-e-2": 10, "dall-e-3": 1}
 
 def image_prompt(theme: str) -> str:
     """
@@ -71,3 +81,77 @@ def generate_image(client: OpenAI, prompt: str) -> str:
         return response.data[0].url
     else:
         raise ValueError("No image generated")
+
+async def generate_images_async(client: AsyncOpenAI, prompt: str, n: int = 1, model: str = IMAGE_MODEL) -> List[str]:
+    """
+    Asynchronously generate one or more images for the same prompt in a single request.
+
+    This is the non-blocking counterpart of generate_image, allowing several
+    requests to run concurrently with asyncio. Models that support it return
+    several images for one request via the API's n parameter, saving a round
+    trip per extra image; DALL-E 3 only accepts n=1.
+
+    Args:
+        client (AsyncOpenAI): An initialized asynchronous OpenAI client instance.
+        prompt (str): A string describing the images to be generated.
+        n (int): How many images to generate, up to MAX_IMAGES_PER_REQUEST for the model.
+        model (str): The image model to use.
+
+    Returns:
+        List[str]: The URLs of the generated images.
+
+    Raises:
+        ValueError: If n is larger than the model allows, or no image is generated by the API.
+        openai.OpenAIError: For any API-related errors (e.g., rate limiting, authentication issues).
+
+    Example:
+        >>> async with AsyncOpenAI(api_key="your-api-key") as client:
+        ...     image_urls = await generate_images_async(client, "A cute cartoon elephant", n=4, model="dall-e-2")
+    """
+    if not 1 <= n <= MAX_IMAGES_PER_REQUEST[model]:
+        raise ValueError(f"{model} can generate between 1 and {MAX_IMAGES_PER_REQUEST[model]} images per request")
+    response = await client.images.generate(
+        model=model,
+        prompt=prompt,
+        size="1024x1024",
+        quality="standard",
+        n=n
+    )
+    if response.data:
+        return [image.url for image in response.data]
+    else:
+        raise ValueError("No image generated")
+
+@retry(
+    retry=retry_if_exception_type((RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)),
+    wait=wait_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(4),
+    reraise=True
+)
+async def generate_images_with_retry(client: AsyncOpenAI, prompt: str, n: int = 1,
+                                     limiter: RateLimiter | None = None) -> List[str]:
+    """
+    Generate images like generate_images_async, retrying transient API failures.
+
+    Rate limit, timeout, connection and server errors are retried up to 4 attempts
+    in total with exponential backoff (capped at 30 seconds between attempts).
+    Any other error, or the last failure, is raised to the caller. When a rate
+    limiter is given, every attempt (including retries) waits for its turn so
+    retries do not add to a burst of requests.
+
+    Args:
+        client (AsyncOpenAI): An initialized asynchronous OpenAI client instance.
+        prompt (str): A string describing the images to be generated.
+        n (int): How many images to generate in the request.
+        limiter (RateLimiter | None): An optional limiter to acquire before each attempt.
+
+    Returns:
+        List[str]: The URLs of the generated images.
+
+    Raises:
+        ValueError: If n is larger than the model allows, or no image is generated by the API.
+        openai.OpenAIError: For API errors that are not retried, or once retries are exhausted.
+    """
+    if limiter is not None:
+        await limiter.acquire()
+    return await generate_images_async(client, prompt, n)
@@ -1,13 +1,29 @@
+import json
 from openai import OpenAI
 from typing import List
 
+# Themes offered before any are generated, so a new session needs no API call to get started.
+DEFAULT_THEMES = [
+    "Animals Around the World",
+    "Underwater Adventures",
+    "Farm Life",
+    "Space Exploration",
+    "Fairy Tale Forest",
+    "Dinosaurs Having a Tea Party",
+    "Magical Garden",
+    "Superheroes",
+    "Vehicles and Transportation",
+    "Underwater Dance Party",
+]
+
 def generate_themes(client: OpenAI) -> List[str]:
     """
-    Generate a list of themes for children's coloring book pages using OpenAI's GPT model.
+    Generate a list of themes for children's coloring book pages using OpenAI's gpt-4o-mini model.
 
     This function sends a prompt to the OpenAI API requesting 10 suitable themes
-    for children's coloring book pages. It then processes the response to return
-    a clean list of themes.
+    for children's coloring book pages. The model is asked to answer in JSON mode,
+    so the themes can be read straight from the parsed response without any
+    free-text cleanup.
 
     Args:
         client (OpenAI): An initialized OpenAI client instance.
@@ -16,6 +32,8 @@ def generate_themes(client: OpenAI) -> List[str]:
         List[str]: A list of 10 generated themes, each as a separate string.
 
     Raises:
+        json.JSONDecodeError: If the response is not valid JSON.
+        KeyError: If the response does not contain a "themes" list.
         openai.OpenAIError: For any API-related errors (e.g., rate limiting, authentication issues).
 
     Example:
@@ -24,9 +42,14 @@ def generate_themes(client: OpenAI) -> List[str]:
         >>> print(themes)
         ['Underwater Adventure', 'Space Exploration', 'Fairy Tale Forest', ...]
     """
-    prompt = "Generate a list of 10 suitable themes for children's coloring book pages."
+    prompt = (
+        "Generate a list of 10 suitable themes for children's coloring book pages. "
+        'Return JSON: {"themes": [10 short theme strings]}'
+    )
     response = client.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": prompt}]
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=200,
+        response_format={"type": "json_object"}
     )
-    return [theme.strip('- ') for theme in response.choices[0].message.content.strip().split('\n')]
+    return json.loads(response.choices[0].message.content)["themes"]
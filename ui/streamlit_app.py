@@ -1,13 +1,8 @@
-import os
 import streamlit as st
-import datetime
-from api.openai_client import create_openai_client
-from openai import OpenAI, AuthenticationError
-from generators.theme_generator import generate_themes
-from generators.image_generator import image_prompt, generate_image
-from utils.file_operations import save_image, create_zip_file
-from utils.image_processing import load_image
-from PIL import Image
+from typing import Dict, List
+
+# The OpenAI SDK and the generator/utility modules are slow to import, so they are
+# imported where they are first needed to keep the app's cold start fast.
 
 def get_api_key() -> str:
     """
@@ -99,6 +94,164 @@ def show_openai_instructions():
             Remember to keep your API key confidential and never share it publicly.
             """)
 
+@st.cache_resource
+def load_static_image(file_path: str) -> bytes:
+    """
+    Read a static image asset once and keep its bytes for every later rerun.
+
+    Streamlit reruns the whole script on each widget interaction. Caching the
+    encoded file bytes means header images are neither re-read from disk nor
+    decoded and re-encoded to PNG by PIL on every rerun.
+
+    Args:
+        file_path (str): The path to the static image file.
+
+    Returns:
+        bytes: The raw contents of the image file.
+    """
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+@st.cache_data(ttl=600, show_spinner=False)
+def validate_api_key(api_key: str) -> bool:
+    """
+    Check an OpenAI API key with a lightweight request, remembering keys that work.
+
+    Streamlit reruns the script on every widget interaction; caching on the key
+    string means the check is made once per key rather than on every rerun.
+    Failures raise and are therefore not cached, so a rejected key is checked
+    again the next time it is used.
+
+    Args:
+        api_key (str): The OpenAI API key to validate.
+
+    Returns:
+        bool: True if the key was accepted by the API.
+
+    Raises:
+        openai.AuthenticationError: If the API key is invalid.
+    """
+    from api.openai_client import create_openai_client
+
+    with create_openai_client(api_key) as client:
+        client.models.list()
+    return True
+
+# Upper bound on image generation requests in flight at once, kept below the API's rate limit.
+MAX_CONCURRENT_REQUESTS = 10
+
+# Default image generation rate, matching DALL-E 3's images-per-minute limit on OpenAI's first usage tier.
+DEFAULT_REQUESTS_PER_MINUTE = 7
+
+async def generate_images(api_key: str, prompt: str, full_folder_path: str, num_images: int,
+                          requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+                          image_cache: Dict[tuple[str, int], bytes] | None = None) -> List[tuple[str, bytes]]:
+    """
+    Generate and save several images concurrently, reporting progress in the Streamlit UI.
+
+    Images are requested from the API at the same time (bounded by
+    MAX_CONCURRENT_REQUESTS) instead of one after another, so the whole batch
+    takes roughly as long as a single image. Models that can return several
+    images per request are asked for them in as few requests as possible.
+    Downloads share one aiohttp session and are streamed to disk without
+    blocking the event loop. Requests are spaced out by a RateLimiter so a large
+    batch does not exceed the account's rate limit, and transient API errors are
+    retried with exponential backoff. Progress is reported in a single st.status
+    container that is updated as each image finishes, in whatever order they
+    complete.
+
+    When an image cache is given, image N of a prompt is looked up under
+    (hash of the prompt, N) first. Cached images are written to the folder
+    without any API call, and newly generated ones are added to the cache.
+    Only the current prompt's images are kept, so the cache never holds more
+    than one batch. The image bytes are cached rather than URLs because
+    OpenAI's image URLs expire.
+
+    Args:
+        api_key (str): The OpenAI API key used to create the async client.
+        prompt (str): The prompt shared by all generated images.
+        full_folder_path (str): The existing folder to save the images into.
+        num_images (int): How many images to generate.
+        requests_per_minute (float): The maximum number of image requests started per minute.
+        image_cache (Dict[tuple[str, int], bytes] | None): Previously generated images to
+            reuse and extend, or None to always generate new images.
+
+    Returns:
+        List[tuple[str, bytes]]: The path and contents of each successfully saved image,
+            ordered by image number.
+    """
+    import asyncio
+    import hashlib
+    from api.openai_client import create_async_openai_client
+    from generators.image_generator import IMAGE_MODEL, MAX_IMAGES_PER_REQUEST, generate_images_with_retry
+    from utils.file_operations import create_download_session, save_image_async, save_image_bytes
+    from utils.rate_limiter import RateLimiter
+
+    prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()
+    if image_cache is not None:
+        # Keep the cache bounded to a single batch by evicting other prompts' images
+        for cache_key in [cache_key for cache_key in image_cache if cache_key[0] != prompt_hash]:
+            del image_cache[cache_key]
+    status = st.status(f"Generating {num_images} images...", expanded=True)
+    results = []
+
+    def record(image_number: int, saved_image: tuple[str, bytes] | None, cached: bool = False) -> None:
+        results.append((image_number, saved_image))
+        status.update(label=f"Generated {len(results)}/{num_images} images...")
+        if saved_image:
+            status.write(f"✓ Image {image_number}" + (" (reused)" if cached else ""))
+            if image_cache is not None:
+                image_cache[(prompt_hash, image_number)] = saved_image[1]
+
+    image_numbers = []
+    for image_number in range(1, num_images + 1):
+        cached_bytes = image_cache.get((prompt_hash, image_number)) if image_cache is not None else None
+        if cached_bytes is not None:
+            record(image_number, save_image_bytes(cached_bytes, full_folder_path, image_number), cached=True)
+        else:
+            image_numbers.append(image_number)
+
+    # Ask for as many images per request as the model allows (one for DALL-E 3).
+    images_per_request = MAX_IMAGES_PER_REQUEST[IMAGE_MODEL]
+    batches = [image_numbers[i:i + images_per_request] for i in range(0, len(image_numbers), images_per_request)]
+
+    if batches:
+        semaphore = asyncio.Semaphore(min(len(batches), MAX_CONCURRENT_REQUESTS))
+        limiter = RateLimiter(requests_per_minute)
+
+        # Retries are handled by generate_images_with_retry, so the SDK's own retries are disabled.
+        async with create_async_openai_client(api_key, max_retries=0) as client, create_download_session() as session:
+            async def save_one(image_url: str, image_number: int) -> tuple[int, tuple[str, bytes] | None]:
+                saved_image = await save_image_async(session, image_url, full_folder_path, image_number)
+                if not saved_image:
+                    st.warning(f"Failed to save image {image_number}")
+                return image_number, saved_image
+
+            async def generate_batch(batch: List[int]) -> List[tuple[int, tuple[str, bytes] | None]]:
+                try:
+                    async with semaphore:
+                        image_urls = await generate_images_with_retry(client, prompt, len(batch), limiter)
+                    return await asyncio.gather(*[save_one(image_url, image_number)
+                                                  for image_url, image_number in zip(image_urls, batch)])
+                except Exception as e:
+                    images = f"image {batch[0]}" if len(batch) == 1 else f"images {batch[0]}-{batch[-1]}"
+                    st.error(f"Error generating {images}: {str(e)}")
+                    return [(image_number, None) for image_number in batch]
+
+            tasks = [generate_batch(batch) for batch in batches]
+            for future in asyncio.as_completed(tasks):
+                for image_number, saved_image in await future:
+                    record(image_number, saved_image)
+
+    generated_images = [saved_image for _, saved_image in sorted(results, key=lambda result: result[0])
+                        if saved_image]
+    status.update(
+        label=f"Generated {len(generated_images)}/{num_images} images",
+        state="complete" if generated_images else "error",
+        expanded=False
+    )
+    return generated_images
+
 def main():
     st.title("🪄 AI Coloring Images Generator 🖍️")
 
@@ -108,12 +261,10 @@ def main():
     ## 🌟 What's This All About?""")
     
     # Load and display the image
-    image = Image.open('./images/magic_garden.png')
-    st.image(image, caption='Its magical')
+    st.image(load_static_image('./images/magic_garden.png'), caption='Its magical', width=512)
 
     # Load and display the image
-    image = Image.open('./images/super.png')
-    st.image(image, caption='Its super')
+    st.image(load_static_image('./images/super.png'), caption='Its super', width=512)
     
     st.markdown("""
     Ever wished you could summon an army of cute, colorable images with just a few clicks? Well, now you can! Our app uses the power of AI to generate custom coloring book pages faster than you can say "pass the crayons!"
@@ -134,16 +285,26 @@ def main():
     if 'selected_theme' not in st.session_state:
         st.session_state.selected_theme = None
 
+    # Generated image bytes for the latest prompt, keyed by (prompt hash, image number), reused across clicks
+    if 'image_cache' not in st.session_state:
+        st.session_state.image_cache = {}
+
     api_key = get_api_key()
     if api_key:
-        try:
-            client = create_openai_client(api_key)
+        from api.openai_client import create_openai_client
+        from generators.theme_generator import DEFAULT_THEMES, generate_themes
+        from openai import AuthenticationError
 
-            # Test the API key with a simple request
-            client.models.list()
+        try:
+            # Test the API key with a simple request (cached per key)
+            validate_api_key(api_key)
             
             if 'themes' not in st.session_state:
-                st.session_state.themes = generate_themes(client)
+                st.session_state.themes = DEFAULT_THEMES
+
+            if st.button("Refresh themes", key="refresh_themes_button"):
+                with create_openai_client(api_key) as client:
+                    st.session_state.themes = generate_themes(client)
             
             # Use session state to maintain the selected theme
             selected_theme = st.selectbox("Select a theme", st.session_state.themes, key="theme_selector", index=st.session_state.themes.index(
@@ -156,43 +317,50 @@ def main():
             num_images = st.slider("Number of images to generate",
                                 min_value=1, max_value=10, value=3, key="num_images_slider")
 
+            requests_per_minute = st.number_input(
+                "Image requests per minute", min_value=1, max_value=500, value=DEFAULT_REQUESTS_PER_MINUTE,
+                key="requests_per_minute_input",
+                help="Match your OpenAI account's image rate limit. Requests are spaced out to stay under it.")
+
+            reuse_images = st.checkbox(
+                "Reuse images already generated for this theme", value=True, key="reuse_images_checkbox",
+                help="Images generated earlier in this session for the same theme are shown again instead of "
+                     "being paid for twice. Untick to always generate new images.")
+
             st.warning(
                 f"You've chosen to generate {num_images} images. Please note that generating more images will increase your API usage and costs.")
 
             if st.button("Generate Images", key="generate_button"):
+                import asyncio
+                import datetime
+                import os
+                from generators.image_generator import image_prompt
+                from utils.file_operations import create_zip_file
+                from utils.image_processing import create_thumbnail
+
                 st.write(
                     f"Creating images based on '{st.session_state.selected_theme}'")
 
                 folder_name = f"{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}_{st.session_state.selected_theme.replace(' ', '_')}"
-                generated_file_paths = []
-
-                progress_bar = st.progress(0)
-                for i in range(num_images):
-                    generate_image_prompt = image_prompt(st.session_state.selected_theme)
-                    try:
-                        image_url = generate_image(client, generate_image_prompt)
-                        file_path = save_image(image_url, folder_name, i + 1)
-                        if file_path:
-                            generated_file_paths.append(file_path)
-                        else:
-                            st.warning(f"Failed to save image {i+1}")
-                    except Exception as e:
-                        st.error(f"Error generating image {i+1}: {str(e)}")
-                    progress_bar.progress((i + 1) / num_images)
-
-                st.write(f"Generated {len(generated_file_paths)} images for theme: {st.session_state.selected_theme}")
-
-                if generated_file_paths:
-                    for file_path in generated_file_paths:
-                        if file_path and os.path.exists(file_path):
-                            st.image(file_path)
-                        else:
-                            st.error(f"Failed to load image: {file_path}")
-
-                    zip_buffer = create_zip_file(folder_name)
+                full_folder_path = os.path.join("download_creation", folder_name)
+                os.makedirs(full_folder_path, exist_ok=True)
+                generate_image_prompt = image_prompt(st.session_state.selected_theme)
+                generated_images = asyncio.run(
+                    generate_images(api_key, generate_image_prompt, full_folder_path, num_images, requests_per_minute,
+                                    st.session_state.image_cache if reuse_images else None))
+
+                st.write(f"Generated {len(generated_images)} images for theme: {st.session_state.selected_theme}")
+
+                if generated_images:
+                    # Show small previews built from the downloaded bytes; the full size images go in the zip
+                    columns = st.columns(3)
+                    for index, (_, image_bytes) in enumerate(generated_images):
+                        columns[index % 3].image(create_thumbnail(image_bytes))
+
+                    # The archive is only built when the user actually clicks the button
                     st.download_button(
                         label="Download Images",
-                        data=zip_buffer.getvalue(),
+                        data=lambda: bytes(create_zip_file(full_folder_path)),
                         file_name=f"{folder_name}.zip",
                         mime="application/zip",
                         key="download_button"
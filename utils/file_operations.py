@@ -1,87 +1,161 @@
 import os
-import requests
+import asyncio
+import aiofiles
+import aiohttp
 import zipfile
-import io
+import streamlit as st
 from typing import List
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from zipstream import ZipStream
 
-def save_image(url: str, folder_name: str, image_number: int) -> str | None:
-    
+# HTTP statuses from the image host that are worth retrying.
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+def save_image_bytes(image_bytes: bytes, full_folder_path: str, image_number: int) -> tuple[str, bytes] | None:
     """
-    Downloads an image from a URL and saves it to a local file.
+    Saves already downloaded image data to a local file.
 
-    This function creates a folder within the 'download_creation' directory,
-    downloads an image from the provided URL, and saves it with a unique filename
-    based on the image number.
+    This function writes the image into the given, already existing folder
+    with the same naming scheme as save_image_async, e.g. to place a previously
+    generated image into a new batch without downloading it again.
 
     Args:
-        url (str): The URL of the image to download.
-        folder_name (str): The name of the folder to create within 'download_creation'.
+        image_bytes (bytes): The encoded image data to save.
+        full_folder_path (str): The existing folder to save the image into.
         image_number (int): A unique number to append to the image filename.
 
     Returns:
-        str | None: The full path of the saved image file if successful, None otherwise.
-
-    Raises:
-        requests.RequestException: If there's an error downloading the image.
-        IOError: If there's an error saving the image to the local file system.
+        tuple[str, bytes] | None: The full path of the saved image file and its contents
+            if successful, None otherwise.
 
     Note:
         This function uses Streamlit's st.error() to display error messages in the UI.
     """
-    full_folder_path = os.path.join("download_creation", folder_name)
-    os.makedirs(full_folder_path, exist_ok=True)
+    file_path = os.path.join(full_folder_path, f"generated_image_{image_number}.png")
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-    except requests.RequestException as e:
-        st.error(f"Error downloading image: {e}")
+        with open(file_path, 'wb') as file:
+            file.write(image_bytes)
+    except IOError as e:
+        st.error(f"Error saving image: {e}")
         return None
     
+    return file_path, image_bytes
+
+def create_download_session() -> aiohttp.ClientSession:
+    """
+    Creates an aiohttp session for downloading generated images concurrently.
+
+    A single session should be shared by all downloads in a batch so they reuse
+    a pool of up to 16 keep-alive connections. It must be created, used and
+    closed inside the same running event loop.
+
+    Returns:
+        aiohttp.ClientSession: A session with a connection limit and a 30 second timeout.
+
+    Example:
+        >>> async with create_download_session() as session:
+        ...     saved = await save_image_async(session, url, "download_creation/my_images", 1)
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+
+def _is_transient_download_error(error: BaseException) -> bool:
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRYABLE_STATUSES
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+@retry(
+    retry=retry_if_exception(_is_transient_download_error),
+    wait=wait_exponential(multiplier=0.5, max=10),
+    stop=stop_after_attempt(4),
+    reraise=True
+)
+async def _download_image(session: aiohttp.ClientSession, url: str, file_path: str) -> bytes:
+    async with session.get(url) as response:
+        response.raise_for_status()
+        chunks = []
+        async with aiofiles.open(file_path, 'wb') as file:
+            async for chunk in response.content.iter_chunked(1 << 16):
+                await file.write(chunk)
+                chunks.append(chunk)
+    return b"".join(chunks)
+
+async def save_image_async(session: aiohttp.ClientSession, url: str, full_folder_path: str,
+                           image_number: int) -> tuple[str, bytes] | None:
+    """
+    Asynchronously downloads an image from a URL and saves it to a local file.
+
+    Chunks are written to disk as they arrive, so downloading and writing
+    overlap, and the event loop stays free to drive other downloads and API
+    calls in the meantime. Connection errors, timeouts and 429/5xx responses
+    are retried up to 4 attempts with exponential backoff, since the image has
+    already been paid for by the time it is downloaded. The downloaded bytes
+    are also returned so callers can display the image without reading the
+    file back from disk.
+
+    Args:
+        session (aiohttp.ClientSession): The shared session to download with.
+        url (str): The URL of the image to download.
+        full_folder_path (str): The existing folder to save the image into.
+        image_number (int): A unique number to append to the image filename.
+
+    Returns:
+        tuple[str, bytes] | None: The full path of the saved image file and its contents
+            if successful, None otherwise.
+
+    Note:
+        This function uses Streamlit's st.error() to display error messages in the UI.
+    """
     file_path = os.path.join(full_folder_path, f"generated_image_{image_number}.png")
     try:
-        with open(file_path, 'wb') as file:
-            file.write(response.content)
+        image_bytes = await _download_image(session, url, file_path)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        st.error(f"Error downloading image: {e}")
+        return None
     except IOError as e:
         st.error(f"Error saving image: {e}")
         return None
     
-    return file_path
+    return file_path, image_bytes
 
-def create_zip_file(folder_name: str) -> io.BytesIO:
+def create_zip_file(full_folder_path: str) -> ZipStream:
     """
-    Creates a ZIP file containing all files from a specified folder.
+    Creates a streamable ZIP archive containing all files from a specified folder.
 
-    This function walks through the specified folder within the 'download_creation' 
-    directory, adds all files to a ZIP archive, and returns the archive as a bytes buffer.
+    This function lists the specified folder and adds all files directly inside
+    it to a ZIP stream. Nothing is read or compressed until the stream is
+    iterated, at which point the archive is produced chunk by chunk, so the
+    whole archive never has to sit in an intermediate buffer.
 
     Args:
-        folder_name (str): The name of the folder within 'download_creation' to zip.
+        full_folder_path (str): The path of the folder to zip.
 
     Returns:
-        io.BytesIO: A bytes buffer containing the ZIP file data.
+        ZipStream: An iterable yielding the ZIP file data as bytes chunks.
 
     Raises:
         OSError: If there's an error accessing the folder or its files.
-        zipfile.BadZipFile: If there's an error creating the ZIP file.
 
     Note:
-        - The function uses DEFLATE compression for the ZIP file.
-        - The original folder structure is preserved in the ZIP file.
-        - The returned buffer's position is reset to the beginning for immediate reading.
+        - PNG files are stored uncompressed; any other files use DEFLATE compression.
+        - Subfolders are not included; the image folders are flat.
+        - A ZipStream can only be iterated once.
 
     Example:
-        >>> zip_buffer = create_zip_file("my_images")
+        >>> zip_stream = create_zip_file("download_creation/my_images")
         >>> with open("my_images.zip", "wb") as f:
-        ...     f.write(zip_buffer.getvalue())
+        ...     for chunk in zip_stream:
+        ...         f.write(chunk)
     """
     
-    zip_buffer = io.BytesIO()
-    full_folder_path = os.path.join("download_creation", folder_name)
-    with zipfile.ZipFile(zip_buffer, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
-        for root, _, files in os.walk(full_folder_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, full_folder_path)
-                zip_file.write(file_path, relative_path)
-    zip_buffer.seek(0)
-    return zip_buffer
+    zip_stream = ZipStream(compress_type=zipfile.ZIP_DEFLATED)
+    # Image folders are flat, so a single scandir pass replaces the recursive os.walk.
+    with os.scandir(full_folder_path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                # PNGs are already DEFLATE-compressed; storing them avoids a second, near useless pass.
+                compress_type = zipfile.ZIP_STORED if entry.name.lower().endswith('.png') else None
+                zip_stream.add_path(entry.path, entry.name, compress_type=compress_type)
+    return zip_stream
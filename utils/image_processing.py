@@ -1,3 +1,4 @@
+import io
 from PIL import Image
 
 def load_image(file_path: str) -> Image.Image:
@@ -23,3 +24,32 @@ def load_image(file_path: str) -> Image.Image:
     """
     
     return Image.open(file_path)
+
+def create_thumbnail(image_bytes: bytes, size: tuple[int, int] = (256, 256)) -> bytes:
+    """
+    Creates a small WEBP preview of an encoded image.
+
+    The image is shrunk to fit within the given size while keeping its aspect
+    ratio and re-encoded as WEBP, which is far smaller than the full resolution
+    PNG. Use it for on-screen previews and keep the original for downloads.
+
+    Args:
+        image_bytes (bytes): The encoded image data (e.g. PNG) to create a preview of.
+        size (tuple[int, int]): The maximum width and height of the thumbnail.
+
+    Returns:
+        bytes: The thumbnail encoded as WEBP.
+
+    Raises:
+        PIL.UnidentifiedImageError: If the data is not a valid image or the format is not recognized.
+
+    Example:
+        >>> with open("path/to/image.png", "rb") as f:
+        ...     thumbnail = create_thumbnail(f.read())
+    """
+    
+    image = Image.open(io.BytesIO(image_bytes))
+    image.thumbnail(size, Image.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, 'WEBP', quality=80)
+    return buffer.getvalue()
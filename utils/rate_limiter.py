@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+class RateLimiter:
+    """
+    Spaces out asynchronous API calls so they stay under a requests-per-minute limit.
+
+    Each call to acquire() reserves the next free time slot and sleeps until it
+    arrives, so a burst of concurrent callers is spread evenly over time instead
+    of hitting the API at once and being rejected with rate limit errors.
+
+    Args:
+        requests_per_minute (float): The maximum number of requests allowed per minute.
+
+    Raises:
+        ValueError: If requests_per_minute is not positive.
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_minute=7)
+        >>> await limiter.acquire()  # returns immediately
+        >>> await limiter.acquire()  # waits about 8.6 seconds
+    """
+
+    def __init__(self, requests_per_minute: float):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.interval = 60 / requests_per_minute
+        self.next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """
+        Wait until the caller is allowed to make its next request.
+
+        The slot is reserved before sleeping, so concurrent callers each get
+        their own slot rather than all seeing the same free one.
+        """
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)